@@ -0,0 +1,23 @@
+# cython: language_level=3
+"""Compiled version of the per-cycle probe list builder
+
+Build in place with: cythonize --inplace -3 _fast_check.pyx
+"""
+
+
+cpdef list build_work(
+    int start, int end, list exts, str base_url, object seen, object missing
+):
+    """Return (index, ext, filename, url) for every file not in seen or missing"""
+    cdef list work = []
+    cdef str prefix = base_url + "/"
+    cdef str ext, filename, url
+    cdef int index
+    for index in range(start, end + 1):
+        for ext in exts:
+            filename = "file_" + str(index) + "." + ext
+            url = prefix + filename
+            if url in seen or filename in missing:
+                continue
+            work.append((index, ext, filename, url))
+    return work
@@ -1,13 +1,48 @@
 import os
 import time
+import queue
+import asyncio
+import threading
+import aiofiles
+import httpx
+import orjson
 import requests
-import schedule
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from collections import deque
 from datetime import datetime
 import logging
+from logging.handlers import QueueHandler, QueueListener
 from typing import List, Optional, Tuple
 from dotenv import load_dotenv, find_dotenv
+from pybloom_live import BloomFilter, ScalableBloomFilter
 import hashlib
 
+try:
+    from _fast_check import build_work
+except ImportError:
+
+    def build_work(
+        start: int, end: int, exts: List[str], base_url: str, seen, missing
+    ) -> List[Tuple[int, str, str, str]]:
+        """Return (index, ext, filename, url) for every file not in seen or missing
+        Pure-Python fallback used when _fast_check.pyx has not been compiled"""
+        # Per-extension formatters, so building a URL or filename is a single call
+        templates = [
+            (ext, ("file_{}." + ext).format, (base_url + "/file_{}." + ext).format)
+            for ext in exts
+        ]
+        work = []
+        for index in range(start, end + 1):
+            for ext, make_filename, make_url in templates:
+                filename = make_filename(index)
+                url = make_url(index)
+                if url in seen or filename in missing:
+                    continue
+                work.append((index, ext, filename, url))
+        return work
+
+
 # Load .env file
 load_dotenv(find_dotenv(), override=True)
 
@@ -17,17 +52,63 @@ CHAT_ID = int(os.getenv("CHAT_ID", 0))
 MONITOR_TOKEN = os.getenv("MONITOR_TOKEN")
 DOWNLOAD_DIR = os.getenv("DOWNLOAD_DIR", "downloaded_files")
 LOG_DIR = os.getenv("LOG_DIR", "logs")
+# Absolute paths resolved once; file paths are built by prefixing these
+DOWNLOAD_DIR_ABS = os.path.abspath(DOWNLOAD_DIR)
+LOG_DIR_ABS = os.path.abspath(LOG_DIR)
+FOUND_FILES_PATH = os.getenv("FOUND_FILES_PATH", "found_files.bloom")
 CHECK_INTERVAL = int(os.getenv("CHECK_INTERVAL", 5))
 REPORT_INTERVAL = int(os.getenv("REPORT_INTERVAL", 6))
 START_INDEX = int(os.getenv("START_INDEX", 0))
 END_INDEX = int(os.getenv("END_INDEX", 100))
+# Number of full check cycles before forgetting which files were missing
+MISSING_RESET_CYCLES = int(os.getenv("MISSING_RESET_CYCLES", 12))
 
 # Get supported file extensions from environment
-SUPPORTED_EXTENSIONS = os.getenv("SUPPORTED_EXTENSIONS", "txt,zip").split(",")
+SUPPORTED_EXTENSIONS = [
+    ext.strip() for ext in os.getenv("SUPPORTED_EXTENSIONS", "txt,zip").split(",")
+]
 
 # Fixed URLs
 BASE_URL = f"https://api.telegram.org/file/bot{MONITOR_TOKEN}/documents"
 
+# Shared HTTP session so all requests reuse pooled keep-alive connections
+SESSION = requests.Session()
+SESSION.mount(
+    "https://",
+    HTTPAdapter(
+        pool_connections=4,
+        pool_maxsize=32,
+        max_retries=Retry(
+            total=3, backoff_factor=0.3, status_forcelist=(429, 500, 502, 503, 504)
+        ),
+    ),
+)
+SESSION.headers.update({"Connection": "keep-alive"})
+
+# Shared async client; HTTP/2 multiplexes probes and downloads over one connection,
+# so a cycle's HEAD requests overlap instead of waiting one round trip each.
+# getFile is not an option: the monitored documents have no known file_id.
+CLIENT = httpx.AsyncClient(
+    http2=True,
+    limits=httpx.Limits(max_connections=32, max_keepalive_connections=16),
+    timeout=10.0,
+)
+
+# Background thread writing log records, started by setup_logging
+_log_listener: Optional[QueueListener] = None
+
+# Telegram flood limits: overall messages per second, and per minute in groups
+TELEGRAM_MESSAGES_PER_SECOND = 25
+TELEGRAM_GROUP_MESSAGES_PER_MINUTE = 15
+TELEGRAM_MAX_ATTEMPTS = 3
+# Messages waiting to be sent; further messages are dropped while it is full
+TELEGRAM_QUEUE_SIZE = 100
+
+# Maximum number of file probes in flight at once
+PROBE_CONCURRENCY = int(os.getenv("PROBE_CONCURRENCY", 16))
+# Bytes written to disk per chunk while downloading
+DOWNLOAD_CHUNK_SIZE = 128 * 1024
+
 
 class StatusReporter:
     def __init__(self):
@@ -73,6 +154,8 @@ def validate_config():
         raise ValueError("START_INDEX must be less than or equal to END_INDEX")
     if not SUPPORTED_EXTENSIONS:
         raise ValueError("SUPPORTED_EXTENSIONS not set, please check .env file")
+    if PROBE_CONCURRENCY < 1:
+        raise ValueError("PROBE_CONCURRENCY must be at least 1")
 
     logging.info("Configuration validation passed")
     logging.debug(
@@ -82,7 +165,8 @@ def validate_config():
         + f"Check interval: {CHECK_INTERVAL} minutes\n"
         + f"Report interval: {REPORT_INTERVAL} hours\n"
         + f"File index range: {START_INDEX} to {END_INDEX}\n"
-        + f"Supported extensions: {', '.join(SUPPORTED_EXTENSIONS)}"
+        + f"Supported extensions: {', '.join(SUPPORTED_EXTENSIONS)}\n"
+        + f"Probe concurrency: {PROBE_CONCURRENCY}"
     )
 
 
@@ -97,28 +181,48 @@ def setup_logging():
     )
 
     # Configure logging format
-    logging.basicConfig(
-        level=logging.INFO,
-        format="%(asctime)s [%(levelname)s] %(message)s",
-        handlers=[
-            logging.FileHandler(log_file, encoding="utf-8"),
-            logging.StreamHandler(),  # Output to console as well
-        ],
-    )
+    formatter = logging.Formatter("%(asctime)s [%(levelname)s] %(message)s")
+    handlers = [
+        logging.FileHandler(log_file, encoding="utf-8"),
+        logging.StreamHandler(),  # Output to console as well
+    ]
+    for handler in handlers:
+        handler.setFormatter(formatter)
+
+    # Write records from a background thread so callers never wait on I/O
+    global _log_listener
+    log_queue = queue.Queue(-1)
+    _log_listener = QueueListener(log_queue, *handlers)
+    _log_listener.start()
+    queue_handler = QueueHandler(log_queue)
+    queue_handler.setFormatter(logging.Formatter("%(message)s"))
+    logging.basicConfig(level=logging.INFO, handlers=[queue_handler])
+
+    # httpx logs every request at INFO, which would flood the log each cycle
+    logging.getLogger("httpx").setLevel(logging.WARNING)
 
     logging.info("=== Logging system initialized ===")
     return log_file
 
 
-def print_status(message: str, is_error: bool = False, notify_telegram: bool = False):
-    """Print status information to log and terminal, optionally notify via Telegram"""
+def stop_logging():
+    """Flush queued log records and stop the logging thread"""
+    if _log_listener is not None:
+        _log_listener.stop()
+
+
+def print_status(
+    fmt: str, *args, is_error: bool = False, notify_telegram: bool = False
+):
+    """Print status information to log and terminal, optionally notify via Telegram
+    Arguments are %-formatted into fmt by logging, only if the record is emitted"""
     if is_error:
-        logging.error(message)
+        logging.error(fmt, *args)
     else:
-        logging.info(message)
+        logging.info(fmt, *args)
 
     if notify_telegram and CHAT_ID:
-        send_telegram_message(message)
+        send_telegram_message(fmt % args if args else fmt)
 
 
 def get_chat_id():
@@ -126,9 +230,9 @@ def get_chat_id():
     try:
         print_status("Attempting to get Chat ID...")
         url = f"https://api.telegram.org/bot{BOT_TOKEN}/getUpdates"
-        response = requests.get(url, timeout=10)
+        response = SESSION.get(url, timeout=10)
         if response.status_code == 200:
-            updates = response.json()
+            updates = orjson.loads(response.content)
             if updates.get("ok") and updates.get("result"):
                 latest_message = updates["result"][-1]
                 chat_id = latest_message["message"]["chat"]["id"]
@@ -137,27 +241,100 @@ def get_chat_id():
                 return chat_id
             print_status(
                 "No messages found. Please start a conversation with the bot (send /start)",
-                True,
+                is_error=True,
             )
             return None
     except Exception as e:
-        print_status(f"Error getting Chat ID: {e}", True)
-        print_status("Please use @userinfobot to get Chat ID manually", True)
+        print_status(f"Error getting Chat ID: {e}", is_error=True)
+        print_status("Please use @userinfobot to get Chat ID manually", is_error=True)
         return None
 
 
+class RateLimiter:
+    """Allow at most max_calls within any window of period seconds"""
+
+    def __init__(self, max_calls: int, period: float):
+        self.max_calls = max_calls
+        self.period = period
+        self.calls = deque()
+
+    def wait(self):
+        """Block until another call fits in the window, then record it"""
+        while True:
+            now = time.monotonic()
+            while self.calls and now - self.calls[0] >= self.period:
+                self.calls.popleft()
+            if len(self.calls) < self.max_calls:
+                self.calls.append(now)
+                return
+            time.sleep(self.period - (now - self.calls[0]))
+
+
+_tg_queue = queue.Queue(TELEGRAM_QUEUE_SIZE)
+_tg_rate_limiter = RateLimiter(TELEGRAM_MESSAGES_PER_SECOND, 1.0)
+_tg_group_rate_limiter = RateLimiter(TELEGRAM_GROUP_MESSAGES_PER_MINUTE, 60.0)
+
+
+def _post_telegram_message(message: str):
+    """Post a message to Telegram, waiting out flood limits"""
+    url = f"https://api.telegram.org/bot{BOT_TOKEN}/sendMessage"
+    body = orjson.dumps({"chat_id": CHAT_ID, "text": message, "parse_mode": "HTML"})
+    for _ in range(TELEGRAM_MAX_ATTEMPTS):
+        _tg_rate_limiter.wait()
+        if CHAT_ID < 0:  # Group chats have negative IDs
+            _tg_group_rate_limiter.wait()
+        try:
+            response = SESSION.post(
+                url,
+                data=body,
+                headers={"Content-Type": "application/json"},
+                timeout=10,
+            )
+        except requests.RequestException as e:
+            print_status(f"Failed to send Telegram message: {e}", is_error=True)
+            return
+        if response.status_code != 429:
+            return
+        try:
+            retry_after = orjson.loads(response.content)["parameters"]["retry_after"]
+        except (ValueError, KeyError, TypeError):
+            retry_after = 1
+        time.sleep(retry_after)
+    print_status("Failed to send Telegram message: rate limited", is_error=True)
+
+
+def _telegram_worker():
+    """Deliver queued Telegram messages until a None sentinel is received"""
+    while True:
+        message = _tg_queue.get()
+        if message is None:
+            break
+        _post_telegram_message(message)
+
+
+_tg_worker = threading.Thread(target=_telegram_worker, name="telegram", daemon=True)
+
+
 def send_telegram_message(message: str):
-    """Send Telegram message"""
+    """Queue Telegram message for the background sender"""
     if not CHAT_ID:
-        print_status("Please set CHAT_ID before running", True)
+        print_status("Please set CHAT_ID before running", is_error=True)
         return
 
-    url = f"https://api.telegram.org/bot{BOT_TOKEN}/sendMessage"
-    data = {"chat_id": CHAT_ID, "text": message, "parse_mode": "HTML"}
     try:
-        requests.post(url, json=data, timeout=10)
-    except requests.RequestException as e:
-        print_status(f"Failed to send Telegram message: {e}", True)
+        _tg_queue.put_nowait(message)
+    except queue.Full:
+        print_status("Telegram message queue full, message dropped", is_error=True)
+
+
+def stop_telegram_worker(timeout: float = 10.0):
+    """Deliver messages still queued, then stop the background sender"""
+    if _tg_worker.is_alive():
+        try:
+            _tg_queue.put(None, timeout=timeout)
+        except queue.Full:
+            return
+        _tg_worker.join(timeout)
 
 
 def calculate_file_hash(file_path: str) -> str:
@@ -172,123 +349,198 @@ def calculate_file_hash(file_path: str) -> str:
 class FileMonitor:
     def __init__(self):
         self.current_index = START_INDEX  # 从START_INDEX开始
-        self.found_files = set()
+        self.found_files = self._load_found_files()
         self.file_hashes = {}  # 存储文件哈希值
+        self.known_missing = self._new_known_missing()
+        self.cycles_since_reset = 0
+        self.probe_error_notified = False
         self.status_reporter = StatusReporter()
         os.makedirs(DOWNLOAD_DIR, exist_ok=True)
 
         # Send initial status message
         startup_message = (
             "🤖 File Monitor System Started\n"
-            f"📂 File save location: {os.path.abspath(DOWNLOAD_DIR)}\n"
+            f"📂 File save location: {DOWNLOAD_DIR_ABS}\n"
             f"📝 Supported file types: {', '.join(SUPPORTED_EXTENSIONS)}\n"
-            f"📋 Log file location: {os.path.abspath(LOG_DIR)}\n"
+            f"📋 Log file location: {LOG_DIR_ABS}\n"
             f"🔍 Index range: {START_INDEX} - {END_INDEX}\n"
             "⏰ Status report will be sent every 6 hours\n"
             "❗ Immediate notification for new files"
         )
         send_telegram_message(startup_message)
 
-    def check_file_exists(self, url: str) -> tuple:
-        """Check if file exists and return its size"""
+    def _load_found_files(self) -> ScalableBloomFilter:
+        """Load the downloaded-URL filter from disk, or start an empty one"""
+        if os.path.exists(FOUND_FILES_PATH):
+            try:
+                with open(FOUND_FILES_PATH, "rb") as f:
+                    return ScalableBloomFilter.fromfile(f)
+            except Exception as e:
+                print_status(
+                    f"Failed to load found files from disk: {e}", is_error=True
+                )
+        # A false positive here makes build_work skip that URL permanently,
+        # across restarts, so a new file is missed about 1% of the time
+        return ScalableBloomFilter(
+            initial_capacity=10000,
+            error_rate=0.01,
+            mode=ScalableBloomFilter.LARGE_SET_GROWTH,
+        )
+
+    def _save_found_files(self):
+        """Persist the downloaded-URL filter so it survives restarts"""
+        # Write a temporary copy and swap it in, so a crash never corrupts it
+        temp_path = FOUND_FILES_PATH + ".tmp"
         try:
-            response = requests.head(url, timeout=10)
+            with open(temp_path, "wb") as f:
+                self.found_files.tofile(f)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(temp_path, FOUND_FILES_PATH)
+        except OSError as e:
+            print_status(f"Failed to save found files to disk: {e}", is_error=True)
+
+    def _new_known_missing(self) -> BloomFilter:
+        """Create an empty filter of files that returned 404"""
+        return BloomFilter(
+            capacity=(END_INDEX - START_INDEX + 1) * len(SUPPORTED_EXTENSIONS),
+            error_rate=0.02,
+        )
+
+    async def check_file_exists(self, url: str) -> Tuple[Optional[bool], int]:
+        """Check if file exists and return its size
+        Returns (None, 0) when existence could not be determined"""
+        try:
+            response = await CLIENT.head(url)
             if response.status_code == 200:
                 file_size = int(response.headers.get("content-length", 0))
                 return True, file_size
-            return False, 0
-        except requests.RequestException as e:
+            if response.status_code == 404:
+                return False, 0
+            return None, 0
+        except httpx.HTTPError as e:
+            # Notify once per cycle; an outage would otherwise fail every probe
             print_status(
-                f"Error checking file existence: {e}", True, notify_telegram=True
+                f"Error checking file existence: {e}",
+                is_error=True,
+                notify_telegram=not self.probe_error_notified,
             )
-            return False, 0
+            self.probe_error_notified = True
+            return None, 0
 
-    def download_file(self, url: str, filename: str) -> bool:
+    async def download_file(
+        self, url: str, filename: str, expected_size: int = 0
+    ) -> bool:
+        temp_path = f"{DOWNLOAD_DIR_ABS}{os.sep}temp_{filename}"
         try:
             print_status(f"Downloading file: {filename}")
-            start_time = datetime.now()
-            response = requests.get(url, timeout=30, stream=True)
-
-            if response.status_code == 200:
-                # 先将文件保存到临时位置
-                temp_path = os.path.join(DOWNLOAD_DIR, f"temp_{filename}")
-                with open(temp_path, "wb") as f:
-                    f.write(response.content)
-
-                # 计算新文件的哈希值
-                new_file_hash = calculate_file_hash(temp_path)
-                file_size = os.path.getsize(temp_path)
-                file_size_mb = file_size / (1024 * 1024)
-
-                # 检查是否存在相同哈希值的文件
-                if new_file_hash in self.file_hashes:
-                    existing_file = self.file_hashes[new_file_hash]
-                    os.remove(temp_path)  # 删除临时文件
+            start_time = time.monotonic()
+            async with CLIENT.stream("GET", url, timeout=30.0) as response:
+                if response.status_code != 200:
+                    # Read just enough of the body for the error message
+                    snippet = b""
+                    async for chunk in response.aiter_bytes():
+                        snippet += chunk
+                        if len(snippet) >= 200:
+                            break
                     print_status(
-                        f"Duplicate file detected: {filename}\n"
-                        f"Identical to existing file: {existing_file}",
+                        f"File download failed: {filename}\n"
+                        f"Status code: {response.status_code}\n"
+                        f"Response: {snippet[:200].decode('utf-8', 'replace')}",
+                        is_error=True,
                         notify_telegram=True,
                     )
-                    return True
-
-                # 如果是新文件，移动到最终位置
-                final_path = os.path.join(DOWNLOAD_DIR, filename)
-                counter = 1
-                while os.path.exists(final_path):
-                    base_name, ext = os.path.splitext(filename)
-                    new_filename = f"{base_name}_{counter}{ext}"
-                    final_path = os.path.join(DOWNLOAD_DIR, new_filename)
-                    counter += 1
-
-                os.rename(temp_path, final_path)
-                self.file_hashes[new_file_hash] = os.path.basename(final_path)
+                    return False
+
+                # 先将文件分块保存到临时位置
+                file_size = 0
+                async with aiofiles.open(temp_path, "wb") as f:
+                    async for chunk in response.aiter_bytes(DOWNLOAD_CHUNK_SIZE):
+                        await f.write(chunk)
+                        file_size += len(chunk)
+                # Content-Length counts encoded bytes, so compare the raw total
+                bytes_received = response.num_bytes_downloaded
+
+            # Reject truncated downloads when the size is known from the HEAD check
+            if expected_size and bytes_received != expected_size:
+                os.remove(temp_path)
+                print_status(
+                    f"File download incomplete: {filename}\n"
+                    f"Expected {expected_size} bytes, received {bytes_received} bytes",
+                    is_error=True,
+                    notify_telegram=True,
+                )
+                return False
 
-                # Calculate download time and speed
-                download_time = (datetime.now() - start_time).total_seconds()
-                download_speed = file_size / (1024 * 1024 * download_time)  # MB/s
+            # 计算新文件的哈希值
+            new_file_hash = calculate_file_hash(temp_path)
+            file_size_mb = file_size / (1024 * 1024)
 
-                # Get file info
-                file_info = (
-                    f"File download completed: {os.path.basename(final_path)}\n"
-                    f"📦 Size: {file_size_mb:.2f} MB\n"
-                    f"⚡ Speed: {download_speed:.2f} MB/s\n"
-                    f"⏱ Time: {download_time:.2f} seconds\n"
-                    f"🔐 Hash: {new_file_hash[:16]}..."  # 显示部分哈希值
+            # 检查是否存在相同哈希值的文件
+            if new_file_hash in self.file_hashes:
+                existing_file = self.file_hashes[new_file_hash]
+                os.remove(temp_path)  # 删除临时文件
+                print_status(
+                    f"Duplicate file detected: {filename}\n"
+                    f"Identical to existing file: {existing_file}",
+                    notify_telegram=True,
                 )
-                print_status(file_info, notify_telegram=True)
                 return True
 
-            print_status(
-                f"File download failed: {filename}\n"
-                f"Status code: {response.status_code}\n"
-                f"Response: {response.text[:200]}",
-                True,
-                notify_telegram=True,
+            # 如果是新文件，原子地占用最终文件名，再移动到该位置
+            base_name, ext = os.path.splitext(filename)
+            final_path = f"{DOWNLOAD_DIR_ABS}{os.sep}{filename}"
+            counter = 1
+            while True:
+                try:
+                    fd = os.open(
+                        final_path, os.O_CREAT | os.O_EXCL | os.O_WRONLY, 0o644
+                    )
+                    break
+                except FileExistsError:
+                    new_filename = f"{base_name}_{counter}{ext}"
+                    final_path = f"{DOWNLOAD_DIR_ABS}{os.sep}{new_filename}"
+                    counter += 1
+            os.close(fd)
+
+            os.replace(temp_path, final_path)
+            self.file_hashes[new_file_hash] = os.path.basename(final_path)
+
+            # Calculate download time and speed
+            download_time = time.monotonic() - start_time
+            download_speed = (
+                file_size / (1024 * 1024 * download_time) if download_time else 0.0
+            )  # MB/s
+
+            # Get file info
+            file_info = (
+                f"File download completed: {os.path.basename(final_path)}\n"
+                f"📦 Size: {file_size_mb:.2f} MB\n"
+                f"⚡ Speed: {download_speed:.2f} MB/s\n"
+                f"⏱ Time: {download_time:.2f} seconds\n"
+                f"🔐 Hash: {new_file_hash[:16]}..."  # 显示部分哈希值
             )
-            return False
-        except requests.RequestException as e:
+            print_status(file_info, notify_telegram=True)
+            return True
+        except httpx.HTTPError as e:
             print_status(
                 f"Error downloading file: {filename}\nError: {str(e)}",
-                True,
+                is_error=True,
                 notify_telegram=True,
             )
             if os.path.exists(temp_path):
                 os.remove(temp_path)  # 清理临时文件
             return False
 
-    def process_file(self, index: int, ext: str) -> Tuple[bool, bool]:
-        """Process a single file with given index and extension
+    async def process_file(self, filename: str, url: str) -> Tuple[bool, bool]:
+        """Process a single file with given filename and URL
         Returns: (file_found, file_downloaded)"""
-        filename = f"file_{index}.{ext}"  # 移除'file_'前缀
-        url = f"{BASE_URL}/{filename}"
-
-        if url in self.found_files:
-            return False, False
-
-        print_status(f"Checking file: {filename}")
+        print_status("Checking file: %s", filename)
         try:
-            exists, file_size = self.check_file_exists(url)
-            if exists:
+            exists, file_size = await self.check_file_exists(url)
+            if exists is False:
+                self.known_missing.add(filename)
+            elif exists:
                 # Notify Telegram only when new file is found
                 file_size_mb = file_size / (1024 * 1024)  # Convert to MB
                 alert_message = (
@@ -298,53 +550,94 @@ class FileMonitor:
                 )
                 send_telegram_message(alert_message)
 
-                if self.download_file(url, filename):
+                if await self.download_file(url, filename, file_size):
                     self.found_files.add(url)
+                    self._save_found_files()
                     return True, True
                 return True, False
         except Exception as e:
             print_status(
-                f"Error processing file {filename}: {e}", True, notify_telegram=True
+                f"Error processing file {filename}: {e}",
+                is_error=True,
+                notify_telegram=True,
             )
         return False, False
 
-    def send_status_report(self):
+    async def send_status_report(self):
         """Send status report"""
         report = self.status_reporter.get_status_report()
         send_telegram_message(report)
 
-    def check_new_files(self):
+    async def _probe(
+        self, semaphore: asyncio.Semaphore, filename: str, url: str
+    ) -> Tuple[bool, bool]:
+        """Process a single file while holding a probe slot"""
+        async with semaphore:
+            return await self.process_file(filename, url)
+
+    async def check_new_files(self):
         print_status("Starting file check...")
-        print_status(f"Current check index: {self.current_index}")
-
-        files_found = 0
-        files_downloaded = 0
-
-        # 检查所有文件从START_INDEX到END_INDEX
-        while self.current_index <= END_INDEX:
-            for ext in SUPPORTED_EXTENSIONS:
-                found, downloaded = self.process_file(self.current_index, ext.strip())
-                if found:
-                    files_found += 1
-                    if downloaded:
-                        files_downloaded += 1
-
-            self.current_index += 1
-            # Reset to START_INDEX if we've reached the end
-            if self.current_index > END_INDEX:
-                self.current_index = START_INDEX
-                print_status(
-                    f"Completed full check cycle ({START_INDEX}-{END_INDEX}), resetting to {START_INDEX}",
-                    notify_telegram=False,
-                )
-                break
+        self.probe_error_notified = False
+        print_status("Current check index: %s", self.current_index)
+
+        # 检查所有文件从current_index到END_INDEX，并发探测
+        work = build_work(
+            self.current_index,
+            END_INDEX,
+            SUPPORTED_EXTENSIONS,
+            BASE_URL,
+            self.found_files,
+            self.known_missing,
+        )
+        # Work is ordered by index, so all extensions of an index run together
+        semaphore = asyncio.Semaphore(PROBE_CONCURRENCY)
+        results = await asyncio.gather(
+            *[self._probe(semaphore, filename, url) for _, _, filename, url in work]
+        )
+
+        files_found = sum(1 for found, _ in results if found)
+        files_downloaded = sum(1 for _, downloaded in results if downloaded)
+
+        # Reset to START_INDEX once the full range has been checked
+        self.current_index = START_INDEX
+        print_status(
+            f"Completed full check cycle ({START_INDEX}-{END_INDEX}), resetting to {START_INDEX}",
+            notify_telegram=False,
+        )
+
+        # Periodically forget missing files so newly published ones are found
+        self.cycles_since_reset += 1
+        if self.cycles_since_reset >= MISSING_RESET_CYCLES:
+            self.known_missing = self._new_known_missing()
+            self.cycles_since_reset = 0
+        self.probe_error_notified = False
 
         # Update status report data
         self.status_reporter.update_stats(files_found, files_downloaded)
         self.status_reporter.current_index = self.current_index
 
 
-def main():
+def _every(seconds: float, fn, failed: asyncio.Future):
+    """Run coroutine function fn every given number of seconds
+    A run is skipped while the previous one is still going; errors resolve failed"""
+    loop = asyncio.get_running_loop()
+    task = None
+
+    def report(done: asyncio.Task):
+        if not done.cancelled() and done.exception() and not failed.done():
+            failed.set_exception(done.exception())
+
+    def fire():
+        nonlocal task
+        loop.call_later(seconds, fire)
+        if task is None or task.done():
+            task = loop.create_task(fn())
+            task.add_done_callback(report)
+
+    loop.call_later(seconds, fire)
+
+
+async def main_async():
     try:
         # Initialize logging system
         log_file = setup_logging()
@@ -355,28 +648,39 @@ def main():
 
         monitor = FileMonitor()
 
-        # Set up scheduled tasks
-        schedule.every(CHECK_INTERVAL).minutes.do(monitor.check_new_files)
-        schedule.every(REPORT_INTERVAL).hours.do(monitor.send_status_report)
-
         logging.info("Performing initial check...")
-        monitor.check_new_files()
+        await monitor.check_new_files()
 
+        # Set up scheduled tasks
         logging.info("Entering monitoring loop...")
-        while True:
-            schedule.run_pending()
-            time.sleep(1)
+        failed = asyncio.get_running_loop().create_future()
+        _every(CHECK_INTERVAL * 60, monitor.check_new_files, failed)
+        _every(REPORT_INTERVAL * 3600, monitor.send_status_report, failed)
+        await failed
 
-    except KeyboardInterrupt:
+    except asyncio.CancelledError:
         logging.info("Termination signal received, program ending")
         send_telegram_message("🛑 File Monitor System Stopped")
+        raise
     except Exception as e:
         error_msg = f"System error occurred: {str(e)}"
         logging.error(error_msg)
         send_telegram_message(f"⚠️ {error_msg}\nPlease check log file: {log_file}")
     finally:
+        await CLIENT.aclose()
         logging.info("=== File Monitor System Stopped ===")
 
 
+def main():
+    _tg_worker.start()
+    try:
+        asyncio.run(main_async())
+    except KeyboardInterrupt:
+        pass
+    finally:
+        stop_telegram_worker()
+        stop_logging()
+
+
 if __name__ == "__main__":
     main()